@@ -12,13 +12,17 @@ under ``assets/cards``.
 """
 from __future__ import annotations
 
-import argparse
+import concurrent.futures
+import functools
 import random
+import re
 import sys
+import threading
 import time
-from dataclasses import dataclass
+import types
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
 
 ASSETS_DIR = Path(__file__).resolve().parent / "assets" / "cards"
 MAX_REDEALS_DEFAULT = 0
@@ -31,6 +35,10 @@ BUTTON_WIDTH = 150
 BUTTON_HEIGHT = 40
 HUD_FONT_SIZE = 20
 MESSAGE_DURATION = 1.5
+TEXT_CACHE_SIZE = 32
+# Event-wait timeouts: ~60 Hz while a timed message is fading, ~4 Hz idle.
+EVENT_WAIT_MESSAGE_MS = 16
+EVENT_WAIT_IDLE_MS = 250
 PLAY_AREA_TOP = 80
 BUTTON_AREA_TOP = 80
 STOCK_X = 80
@@ -49,9 +57,9 @@ try:
 except ImportError:  # pragma: no cover - optional dependency
     requests = None  # type: ignore
 
-import io
 import zipfile
 import shutil
+import tempfile
 import urllib.request
 
 
@@ -76,7 +84,24 @@ VALUES = {
     "K": 13,
     JOKER_RANK: 0,
 }
+# Partner value under the Match-13 pair rule, indexed by card value;
+# -1 where no plain pair exists (the Joker and Kings are handled separately).
+COMPLEMENT = [-1] + [13 - value for value in range(1, 13)] + [-1]
 ALL_CARD_KEYS = [(rank, suit) for suit in SUITS for rank in RANKS] + [(JOKER_RANK, JOKER_SUIT)]
+PYRAMID_ROW_COLS = [(row, col) for row in range(7) for col in range(row + 1)]
+PYRAMID_INDEX = {(row, col): row * (row + 1) // 2 + col for row, col in PYRAMID_ROW_COLS}
+# Flat index of each slot's left child in the row below (-1 for the last row);
+# the right child is always the next slot over.
+CHILD_LEFT = [PYRAMID_INDEX[(row + 1, col)] if row < 6 else -1 for row, col in PYRAMID_ROW_COLS]
+# Bitboard mask of each slot's two children (0 for the last row): a slot is
+# exposed when it is occupied and none of its children bits are.
+CHILDREN_MASK = [(0b11 << child) if child >= 0 else 0 for child in CHILD_LEFT]
+
+
+@functools.lru_cache(maxsize=None)
+def get_font(name: str, size: int, bold: bool = False) -> pygame.font.Font:
+    """Memoized SysFont lookup; font discovery walks the filesystem."""
+    return pygame.font.SysFont(name, size, bold=bold)
 
 
 @dataclass(frozen=True)
@@ -85,10 +110,11 @@ class Card:
 
     rank: str
     suit: str
+    index: int = -1  # position in ALL_CARD_KEYS, assigned by the pool builder
+    value: int = field(init=False)  # rank value, precomputed to avoid dict lookups
 
-    @property
-    def value(self) -> int:
-        return VALUES.get(self.rank, 0)
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "value", VALUES.get(self.rank, 0))
 
     @property
     def key(self) -> Tuple[str, str]:
@@ -100,13 +126,20 @@ class Card:
         return f"{self.rank}{self.suit}"
 
 
+# Canonical Card singletons; Card is frozen and fully determined by (rank, suit),
+# so decks copy this pool instead of allocating 53 fresh instances per game.
+CARD_POOL: Tuple[Card, ...] = tuple(
+    Card(rank, suit, index) for index, (rank, suit) in enumerate(ALL_CARD_KEYS)
+)
+CARD_BY_KEY: Dict[Tuple[str, str], Card] = {card.key: card for card in CARD_POOL}
+
+
 class Deck:
-    """Standard 52-card deck."""
+    """Standard 52-card deck plus the Joker."""
 
     def __init__(self, seed: Optional[int] = None) -> None:
         self.random = random.Random(seed)
-        self.cards: List[Card] = [Card(rank, suit) for suit in SUITS for rank in RANKS]
-        self.cards.append(Card(JOKER_RANK, JOKER_SUIT))
+        self.cards: List[Card] = list(CARD_POOL)
         self.shuffle()
 
     def shuffle(self) -> None:
@@ -117,49 +150,86 @@ class Deck:
 
 
 class Pyramid:
-    """Seven-row pyramid of cards."""
+    """Seven-row pyramid of cards stored as a flat 28-slot list."""
 
     def __init__(self, cards: Sequence[Card]):
-        self.rows: List[List[Optional[Card]]] = []
-        iterator = iter(cards)
-        for row_length in range(1, 8):
-            row: List[Optional[Card]] = []
-            for _ in range(row_length):
-                row.append(next(iterator, None))
-            self.rows.append(row)
-        self.removed = [[False for _ in row] for row in self.rows]
+        self.cards: List[Optional[Card]] = list(cards)[:28]
+        self.cards.extend([None] * (28 - len(self.cards)))
+        self.occupied_mask = 0
+        for idx in range(28):
+            if self.cards[idx] is not None:
+                self.occupied_mask |= 1 << idx
+        self.exposed_mask = 0
+        self.exposed_value_hist: List[int] = [0] * 14
+        for idx in range(28):
+            if self._slot_exposed(idx):
+                self.exposed_mask |= 1 << idx
+                self.exposed_value_hist[self.cards[idx].value] += 1
 
     def card_at(self, row: int, col: int) -> Optional[Card]:
-        return self.rows[row][col]
+        return self.cards[PYRAMID_INDEX[(row, col)]]
 
     def remove_card(self, row: int, col: int) -> Optional[Card]:
-        card = self.rows[row][col]
+        idx = PYRAMID_INDEX[(row, col)]
+        card = self.cards[idx]
         if card is not None:
-            self.rows[row][col] = None
-            self.removed[row][col] = True
+            if self.exposed_mask & (1 << idx):
+                self.exposed_mask &= ~(1 << idx)
+                self.exposed_value_hist[card.value] -= 1
+            self.cards[idx] = None
+            self.occupied_mask &= ~(1 << idx)
+            self._refresh_parent_exposure(row, col)
         return card
 
     def restore_card(self, row: int, col: int, card: Card) -> None:
-        self.rows[row][col] = card
-        self.removed[row][col] = False
+        idx = PYRAMID_INDEX[(row, col)]
+        self.cards[idx] = card
+        self.occupied_mask |= 1 << idx
+        if self._slot_exposed(idx):
+            self.exposed_mask |= 1 << idx
+            self.exposed_value_hist[card.value] += 1
+        self._refresh_parent_exposure(row, col)
 
     def is_exposed(self, row: int, col: int) -> bool:
-        if self.rows[row][col] is None:
-            return False
-        if row == len(self.rows) - 1:
-            return True
-        return self.rows[row + 1][col] is None and self.rows[row + 1][col + 1] is None
+        return bool(self.exposed_mask >> PYRAMID_INDEX[(row, col)] & 1)
+
+    def _slot_exposed(self, idx: int) -> bool:
+        return bool(self.occupied_mask >> idx & 1) and not (
+            self.occupied_mask & CHILDREN_MASK[idx]
+        )
+
+    def _refresh_parent_exposure(self, row: int, col: int) -> None:
+        # Removing or restoring a card can only flip its parents' exposure;
+        # the parents' cards themselves stay in place.
+        for r, c in ((row - 1, col - 1), (row - 1, col)):
+            if r < 0 or c < 0 or c > r:
+                continue
+            idx = PYRAMID_INDEX[(r, c)]
+            bit = 1 << idx
+            was_exposed = bool(self.exposed_mask & bit)
+            now_exposed = self._slot_exposed(idx)
+            if now_exposed and not was_exposed:
+                self.exposed_mask |= bit
+                self.exposed_value_hist[self.cards[idx].value] += 1
+            elif was_exposed and not now_exposed:
+                self.exposed_mask &= ~bit
+                self.exposed_value_hist[self.cards[idx].value] -= 1
 
     def all_cards(self) -> Iterable[Tuple[int, int, Optional[Card]]]:
-        for r, row in enumerate(self.rows):
-            for c, card in enumerate(row):
-                yield r, c, card
+        for (row, col), card in zip(PYRAMID_ROW_COLS, self.cards):
+            yield row, col, card
+
 
+# Location kinds; a location is a (kind, a, b) tuple of small ints.
+LOC_PYRAMID = 0
+LOC_WASTE = 1
 
-@dataclass
-class Move:
-    type: str
-    payload: dict
+# History entry tags; each entry is a small tuple starting with one of these.
+M_DRAW = 0
+M_KING_PYRAMID = 1
+M_KING_WASTE = 2
+M_PAIR = 3
+M_REDEAL = 4
 
 
 class GameState:
@@ -168,26 +238,32 @@ class GameState:
     def __init__(self, seed: Optional[int], max_redeals: int):
         self.seed = seed
         self.max_redeals = max_redeals
-        self.history: List[Move] = []
+        self.history: List[Tuple] = []
         self.score = 0
+        self._legal_cache: Optional[bool] = None
+        # Bumped on every reset so renderer caches can tell deals apart.
+        self.generation = 0
         self.reset()
 
     def reset(self) -> None:
+        self.generation += 1
         deck = Deck(self.seed)
-        pyramid_cards = [deck.deal() for _ in range(28)]
+        pyramid_cards = deck.cards[:-29:-1]  # same order 28 deal() pops would produce
+        del deck.cards[-28:]
         self.pyramid = Pyramid(pyramid_cards)
-        self.stock: List[Card] = deck.cards[:]  # remaining cards (deck.cards already shuffled)
+        self.stock: List[Card] = deck.cards  # remaining cards (deck.cards already shuffled)
         self.waste: List[Card] = []
         self.removed_count = 0
         self.redeals_used = 0
         self.score = 0
         self.history.clear()
+        self._legal_cache = None
 
-    def card_exposed(self, location: Tuple[str, int, int]) -> bool:
+    def card_exposed(self, location: Tuple[int, int, int]) -> bool:
         loc_type, a, b = location
-        if loc_type == "pyramid":
+        if loc_type == LOC_PYRAMID:
             return self.pyramid.is_exposed(a, b)
-        if loc_type == "waste":
+        if loc_type == LOC_WASTE:
             return bool(self.waste) and a == len(self.waste) - 1
         return False
 
@@ -195,44 +271,49 @@ class GameState:
         card = self.pyramid.remove_card(row, col)
         if card:
             self.removed_count += 1
+            self._legal_cache = None
         return card
 
     def restore_pyramid_card(self, row: int, col: int, card: Card) -> None:
         self.pyramid.restore_card(row, col, card)
         self.removed_count -= 1
+        self._legal_cache = None
 
     def draw(self) -> bool:
         if not self.stock:
             return False
         card = self.stock.pop()
         self.waste.append(card)
-        self.history.append(Move("draw", {"card": card}))
+        self.history.append((M_DRAW, card))
+        self._legal_cache = None
         return True
 
     def undo_draw(self, card: Card) -> None:
         assert self.waste and self.waste[-1] == card
         self.waste.pop()
         self.stock.append(card)
+        self._legal_cache = None
 
-    def remove_king(self, location: Tuple[str, int, int]) -> bool:
+    def remove_king(self, location: Tuple[int, int, int]) -> bool:
         loc_type, a, b = location
-        if loc_type == "pyramid":
+        if loc_type == LOC_PYRAMID:
             card = self.pyramid.card_at(a, b)
             if card and card.value == 13 and self.pyramid.is_exposed(a, b):
                 self.remove_pyramid_card(a, b)
-                self.history.append(Move("remove_king_pyramid", {"row": a, "col": b, "card": card}))
+                self.history.append((M_KING_PYRAMID, a, b, card))
                 return True
-        elif loc_type == "waste" and self.waste:
+        elif loc_type == LOC_WASTE and self.waste:
             if self.waste[-1].value == 13:
                 card = self.waste.pop()
-                self.history.append(Move("remove_king_waste", {"card": card}))
+                self.history.append((M_KING_WASTE, card))
+                self._legal_cache = None
                 return True
         return False
 
     def remove_pair(
         self,
-        first: Tuple[str, int, int],
-        second: Tuple[str, int, int],
+        first: Tuple[int, int, int],
+        second: Tuple[int, int, int],
     ) -> bool:
         if first == second:
             return False
@@ -244,66 +325,69 @@ class GameState:
             return False
         if not self.card_exposed(first) or not self.card_exposed(second):
             return False
-        removed_cards: List[Tuple[str, int, int, Card]] = []
+        removed_cards: List[Tuple[int, int, int, Card]] = []
         for location in (first, second):
             loc_type, a, b = location
-            if loc_type == "pyramid":
+            if loc_type == LOC_PYRAMID:
                 card = self.remove_pyramid_card(a, b)
                 if card:
                     removed_cards.append((loc_type, a, b, card))
-            elif loc_type == "waste" and self.waste:
+            elif loc_type == LOC_WASTE and self.waste:
                 card = self.waste.pop()
                 removed_cards.append((loc_type, a, b, card))
         if len(removed_cards) != 2:
             for loc_type, a, b, card in reversed(removed_cards):
-                if loc_type == "pyramid":
+                if loc_type == LOC_PYRAMID:
                     self.restore_pyramid_card(a, b, card)
-                elif loc_type == "waste":
+                elif loc_type == LOC_WASTE:
                     self.waste.append(card)
             return False
         score_awarded = POINTS_PER_PAIR
         self.score += score_awarded
-        self.history.append(
-            Move("remove_pair", {"cards": removed_cards, "score_awarded": score_awarded})
-        )
+        self.history.append((M_PAIR, removed_cards, score_awarded))
+        self._legal_cache = None
         return True
 
-    def get_card(self, location: Tuple[str, int, int]) -> Optional[Card]:
+    def get_card(self, location: Tuple[int, int, int]) -> Optional[Card]:
         loc_type, a, b = location
-        if loc_type == "pyramid":
+        if loc_type == LOC_PYRAMID:
             return self.pyramid.card_at(a, b)
-        if loc_type == "waste":
+        if loc_type == LOC_WASTE:
             if self.waste and a == len(self.waste) - 1:
                 return self.waste[-1]
         return None
 
     def _cards_can_pair(self, card_a: Card, card_b: Card) -> bool:
-        if card_a.rank == JOKER_RANK or card_b.rank == JOKER_RANK:
+        if card_a.value == 0 or card_b.value == 0:  # Joker
             return True
-        return card_a.value + card_b.value == 13
+        return COMPLEMENT[card_a.value] == card_b.value
 
     def undo(self) -> bool:
         if not self.history:
             return False
         move = self.history.pop()
-        if move.type == "draw":
-            self.undo_draw(move.payload["card"])
-        elif move.type == "remove_king_pyramid":
-            self.restore_pyramid_card(move.payload["row"], move.payload["col"], move.payload["card"])
-        elif move.type == "remove_king_waste":
-            self.waste.append(move.payload["card"])
-        elif move.type == "remove_pair":
-            cards: List[Tuple[str, int, int, Card]] = move.payload["cards"]
+        tag = move[0]
+        if tag == M_DRAW:
+            self.undo_draw(move[1])
+        elif tag == M_KING_PYRAMID:
+            self.restore_pyramid_card(move[1], move[2], move[3])
+        elif tag == M_KING_WASTE:
+            self.waste.append(move[1])
+        elif tag == M_PAIR:
+            cards: List[Tuple[int, int, int, Card]] = move[1]
             for loc_type, a, b, card in reversed(cards):
-                if loc_type == "pyramid":
+                if loc_type == LOC_PYRAMID:
                     self.restore_pyramid_card(a, b, card)
-                elif loc_type == "waste":
+                elif loc_type == LOC_WASTE:
                     self.waste.append(card)
-            self.score -= move.payload.get("score_awarded", 0)
-        elif move.type == "redeal":
-            self.stock = move.payload["stock_before"]
-            self.waste = move.payload["waste_before"]
+            self.score -= move[2]
+        elif tag == M_REDEAL:
+            moved = move[1]
+            self.waste = self.stock[-moved:]
+            del self.stock[-moved:]
+            self.waste.reverse()
             self.redeals_used -= 1
+        self._legal_cache = None
         return True
 
     def redeal(self) -> bool:
@@ -311,43 +395,35 @@ class GameState:
             return False
         if not self.waste:
             return False
-        stock_before = self.stock[:]
-        waste_before = self.waste[:]
-        self.stock = self.stock[:] + list(reversed(self.waste))
+        moved = len(self.waste)
+        self.stock.extend(reversed(self.waste))
         self.waste.clear()
         self.redeals_used += 1
-        self.history.append(
-            Move(
-                "redeal",
-                {"stock_before": stock_before, "waste_before": waste_before},
-            )
-        )
+        self._legal_cache = None
+        self.history.append((M_REDEAL, moved))
         return True
 
     def has_won(self) -> bool:
         return self.removed_count >= 28
 
     def legal_moves_remaining(self) -> bool:
+        if self._legal_cache is None:
+            self._legal_cache = self._compute_legal_moves()
+        return self._legal_cache
+
+    def _compute_legal_moves(self) -> bool:
         # Check stock or redeals
         if self.stock or (self.waste and self.redeals_used < self.max_redeals):
             return True
-        exposed_cards: List[Card] = []
-        for r, c, card in self.pyramid.all_cards():
-            if card and self.pyramid.is_exposed(r, c):
-                exposed_cards.append(card)
-                if card.value == 13:
-                    return True
+        hist = self.pyramid.exposed_value_hist[:]
         if self.waste:
-            card = self.waste[-1]
-            exposed_cards.append(card)
-            if card.value == 13:
-                return True
-        # Check pairs summing to 13 or involving jokers
-        for i, first in enumerate(exposed_cards):
-            for second in exposed_cards[i + 1 :]:
-                if self._cards_can_pair(first, second):
-                    return True
-        return False
+            hist[self.waste[-1].value] += 1
+        if hist[13]:
+            return True
+        if hist[0] and sum(hist) > 1:
+            # A Joker pairs with any other exposed card
+            return True
+        return any(hist[value] and hist[COMPLEMENT[value]] for value in range(1, 7))
 
 
 class AssetsManager:
@@ -355,8 +431,10 @@ class AssetsManager:
 
     def __init__(self, target_dir: Path) -> None:
         self.target_dir = target_dir
-        self.card_images: Dict[Tuple[str, str], pygame.Surface] = {}
+        self.card_images: List[pygame.Surface] = []
         self.back_image: Optional[pygame.Surface] = None
+        self._install_lock = threading.Lock()
+        self._installed = False
 
     def ensure_assets(self) -> None:
         if (
@@ -369,15 +447,26 @@ class AssetsManager:
             return
         self.target_dir.mkdir(parents=True, exist_ok=True)
         attempts = [self._download_and_prepare_kenney, self._download_and_prepare_byron]
-        for attempt in attempts:
-            try:
-                attempt()
-                self._ensure_joker_asset()
-                return
-            except Exception:
-                shutil.rmtree(self.target_dir, ignore_errors=True)
-                self.target_dir.mkdir(parents=True, exist_ok=True)
-                continue
+        # Race both mirrors; the first successful download installs the assets
+        # and the loser skips installation under the lock.
+        self._installed = False
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(attempts))
+        try:
+            futures = [executor.submit(attempt) for attempt in attempts]
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    future.result()
+                except Exception:
+                    continue
+                if self._installed:
+                    break
+        finally:
+            executor.shutdown(wait=not self._installed, cancel_futures=True)
+        if self._installed:
+            self._ensure_joker_asset()
+            return
+        shutil.rmtree(self.target_dir, ignore_errors=True)
+        self.target_dir.mkdir(parents=True, exist_ok=True)
         try:
             self._generate_placeholder_assets()
             self._ensure_joker_asset()
@@ -386,24 +475,34 @@ class AssetsManager:
                 "Failed to prepare card assets. Please install pygame with font support or connect to the internet and try again."
             ) from exc
 
-    def _download_zip(self, url: str) -> bytes:
+    def _download_zip(self, url: str) -> tempfile.SpooledTemporaryFile:
+        # Stream into a spooled file so large archives never sit fully in RAM.
+        spool = tempfile.SpooledTemporaryFile(max_size=16 * 1024 * 1024)
         if requests is not None:
-            response = requests.get(url, timeout=60)
-            response.raise_for_status()
-            return response.content
-        with urllib.request.urlopen(url, timeout=60) as resp:
-            return resp.read()
+            with requests.get(url, timeout=60, stream=True) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(64 * 1024):
+                    spool.write(chunk)
+        else:
+            with urllib.request.urlopen(url, timeout=60) as resp:
+                shutil.copyfileobj(resp, spool)
+        spool.seek(0)
+        return spool
 
     def _download_and_prepare_kenney(self) -> None:
         url = "https://github.com/kenneyNL/playing-cards-pack/archive/refs/heads/master.zip"
-        data = self._download_zip(url)
-        with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        with self._download_zip(url) as data, zipfile.ZipFile(data) as zf:
             tmp_dir = Path(self.target_dir.parent) / "_kenney_tmp"
             if tmp_dir.exists():
                 shutil.rmtree(tmp_dir)
             tmp_dir.mkdir(parents=True)
             try:
-                zf.extractall(tmp_dir)
+                members = [
+                    name
+                    for name in zf.namelist()
+                    if "/PNG/Cards/" in name or "/PNG/Backs/" in name
+                ]
+                zf.extractall(tmp_dir, members=members)
                 base = next(tmp_dir.glob("playing-cards-pack-*/PNG"))
                 cards_dir = base / "Cards"
                 backs_dir = base / "Backs"
@@ -423,31 +522,39 @@ class AssetsManager:
                     "Q": "Q",
                     "K": "K",
                 }
-                for suit, suit_name in suit_names.items():
-                    for rank, rank_name in rank_names.items():
-                        filename = f"card{suit_name}{rank_name}.png"
-                        source = cards_dir / filename
-                        if not source.exists():
-                            raise FileNotFoundError(f"Missing expected card image {filename}")
-                        dest = self.target_dir / f"{rank}{suit}.png"
-                        shutil.copyfile(source, dest)
                 back_source = backs_dir / "cardBack_blue2.png"
                 if not back_source.exists():
                     back_source = next(backs_dir.glob("cardBack_*.png"))
-                shutil.copyfile(back_source, self.target_dir / "back.png")
+                with self._install_lock:
+                    if self._installed:
+                        return
+                    for suit, suit_name in suit_names.items():
+                        for rank, rank_name in rank_names.items():
+                            filename = f"card{suit_name}{rank_name}.png"
+                            source = cards_dir / filename
+                            if not source.exists():
+                                raise FileNotFoundError(f"Missing expected card image {filename}")
+                            dest = self.target_dir / f"{rank}{suit}.png"
+                            shutil.copyfile(source, dest)
+                    shutil.copyfile(back_source, self.target_dir / "back.png")
+                    self._installed = True
             finally:
                 shutil.rmtree(tmp_dir, ignore_errors=True)
 
     def _download_and_prepare_byron(self) -> None:
         url = "https://github.com/byronknoll/playing-cards/archive/refs/heads/master.zip"
-        data = self._download_zip(url)
-        with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        with self._download_zip(url) as data, zipfile.ZipFile(data) as zf:
             tmp_dir = Path(self.target_dir.parent) / "_byron_tmp"
             if tmp_dir.exists():
                 shutil.rmtree(tmp_dir)
             tmp_dir.mkdir(parents=True)
             try:
-                zf.extractall(tmp_dir)
+                members = [
+                    name
+                    for name in zf.namelist()
+                    if "/png/1x/" in name or "/png/back/" in name
+                ]
+                zf.extractall(tmp_dir, members=members)
                 base = next(tmp_dir.glob("playing-cards-*/png/1x"))
                 rank_names = {
                     "A": "ace",
@@ -465,26 +572,30 @@ class AssetsManager:
                     "K": "king",
                 }
                 suit_names = {"C": "clubs", "D": "diamonds", "H": "hearts", "S": "spades"}
-                for suit, suit_name in suit_names.items():
-                    for rank, rank_name in rank_names.items():
-                        filename = f"{rank_name}_of_{suit_name}.png"
-                        source = base / filename
-                        if not source.exists():
-                            raise FileNotFoundError(f"Missing expected card image {filename}")
-                        dest = self.target_dir / f"{rank}{suit}.png"
-                        shutil.copyfile(source, dest)
                 back_candidates = list((base.parent / "back").glob("*.png"))
                 if not back_candidates:
                     raise FileNotFoundError("No card back image found in Byron pack")
-                shutil.copyfile(back_candidates[0], self.target_dir / "back.png")
+                with self._install_lock:
+                    if self._installed:
+                        return
+                    for suit, suit_name in suit_names.items():
+                        for rank, rank_name in rank_names.items():
+                            filename = f"{rank_name}_of_{suit_name}.png"
+                            source = base / filename
+                            if not source.exists():
+                                raise FileNotFoundError(f"Missing expected card image {filename}")
+                            dest = self.target_dir / f"{rank}{suit}.png"
+                            shutil.copyfile(source, dest)
+                    shutil.copyfile(back_candidates[0], self.target_dir / "back.png")
+                    self._installed = True
             finally:
                 shutil.rmtree(tmp_dir, ignore_errors=True)
 
     def _generate_placeholder_assets(self) -> None:
         needs_quit = False
         needs_font_quit = False
-        if not pygame.get_init():
-            pygame.init()
+        if not pygame.display.get_init():
+            pygame.display.init()
             needs_quit = True
         if not pygame.font.get_init():
             pygame.font.init()
@@ -498,9 +609,9 @@ class AssetsManager:
             rank_font_size = max(16, int(CARD_HEIGHT * 0.4))
             suit_font_size = max(14, int(CARD_HEIGHT * 0.35))
             center_font_size = max(24, int(CARD_HEIGHT * 0.6))
-            rank_font = pygame.font.SysFont("arial", rank_font_size, bold=True)
-            suit_font = pygame.font.SysFont("arial", suit_font_size)
-            center_font = pygame.font.SysFont("arial", center_font_size, bold=True)
+            rank_font = get_font("arial", rank_font_size, bold=True)
+            suit_font = get_font("arial", suit_font_size)
+            center_font = get_font("arial", center_font_size, bold=True)
             padding = max(4, int(CARD_WIDTH * 0.18))
 
             for rank in RANKS:
@@ -537,9 +648,11 @@ class AssetsManager:
             pygame.image.save(back_surface, str(self.target_dir / "back.png"))
         finally:
             if needs_font_quit:
+                # Cached Font objects die with the font module.
+                get_font.cache_clear()
                 pygame.font.quit()
             if needs_quit:
-                pygame.quit()
+                pygame.display.quit()
 
     def _ensure_joker_asset(self) -> None:
         filename = self.target_dir / f"{JOKER_RANK}{JOKER_SUIT}.png"
@@ -547,8 +660,8 @@ class AssetsManager:
             return
         needs_quit = False
         needs_font_quit = False
-        if not pygame.get_init():
-            pygame.init()
+        if not pygame.display.get_init():
+            pygame.display.init()
             needs_quit = True
         if not pygame.font.get_init():
             pygame.font.init()
@@ -557,43 +670,49 @@ class AssetsManager:
             surface = pygame.Surface((CARD_WIDTH, CARD_HEIGHT), pygame.SRCALPHA)
             surface.fill((250, 250, 250))
             pygame.draw.rect(surface, (120, 20, 120), surface.get_rect(), 6, border_radius=10)
-            font_large = pygame.font.SysFont("arial", max(24, int(CARD_HEIGHT * 0.45)), bold=True)
+            font_large = get_font("arial", max(24, int(CARD_HEIGHT * 0.45)), bold=True)
             text = font_large.render("JOKER", True, (180, 0, 0))
             text_rect = text.get_rect(center=(CARD_WIDTH // 2, CARD_HEIGHT // 2))
             surface.blit(text, text_rect)
-            accent_font = pygame.font.SysFont("arial", max(18, int(CARD_HEIGHT * 0.3)))
+            accent_font = get_font("arial", max(18, int(CARD_HEIGHT * 0.3)))
             accent_text = accent_font.render("🃏", True, (20, 80, 160))
             surface.blit(accent_text, (8, 8))
             surface.blit(accent_text, (CARD_WIDTH - accent_text.get_width() - 8, CARD_HEIGHT - accent_text.get_height() - 8))
             pygame.image.save(surface, str(filename))
         finally:
             if needs_font_quit:
+                # Cached Font objects die with the font module.
+                get_font.cache_clear()
                 pygame.font.quit()
             if needs_quit:
-                pygame.quit()
+                pygame.display.quit()
 
     def load_images(self) -> None:
+        if self.card_images:
+            return
         self.ensure_assets()
+        images: List[pygame.Surface] = []
         for rank, suit in ALL_CARD_KEYS:
             path = self.target_dir / f"{rank}{suit}.png"
             image = pygame.image.load(str(path)).convert_alpha()
             image = pygame.transform.smoothscale(image, (CARD_WIDTH, CARD_HEIGHT))
-            self.card_images[(rank, suit)] = image
+            images.append(image.convert_alpha())
+        self.card_images = images
         back_path = self.target_dir / "back.png"
         back_image = pygame.image.load(str(back_path)).convert_alpha()
-        self.back_image = pygame.transform.smoothscale(back_image, (CARD_WIDTH, CARD_HEIGHT))
+        back_image = pygame.transform.smoothscale(back_image, (CARD_WIDTH, CARD_HEIGHT))
+        self.back_image = back_image.convert_alpha()
 
     def get_surface(self, card: Card) -> pygame.Surface:
-        return self.card_images[card.key]
+        return self.card_images[card.index]
 
     def get_back_surface(self) -> pygame.Surface:
         assert self.back_image is not None
         return self.back_image
 
 
-@dataclass
-class SelectedCard:
-    location: Tuple[str, int, int]
+class SelectedCard(NamedTuple):
+    location: Tuple[int, int, int]
 
 
 class Renderer:
@@ -602,15 +721,57 @@ class Renderer:
     def __init__(self, screen: pygame.Surface, assets: AssetsManager):
         self.screen = screen
         self.assets = assets
-        self.font = pygame.font.SysFont("arial", HUD_FONT_SIZE)
+        self.font = get_font("arial", HUD_FONT_SIZE)
         self.message: Optional[str] = None
         self.message_until: float = 0.0
-        self.button_font = pygame.font.SysFont("arial", 22)
+        self.button_font = get_font("arial", 22)
         self.buttons: Dict[str, pygame.Rect] = {}
         self.background_color = (16, 96, 64)
+        self._cached_surface: Optional[pygame.Surface] = None
+        self._cache_key: Optional[Tuple] = None
+        self._bg_cache: Optional[pygame.Surface] = None
+        self._message_rect: Optional[pygame.Rect] = None
+        self._present_size: Optional[Tuple[int, int]] = None
+        self._card_rects: List[pygame.Rect] = []
+        self._layout_width: Optional[int] = None
+        self._pyramid_atlas: Optional[pygame.Surface] = None
+        self._pyramid_atlas_key: Optional[Tuple] = None
+        self._text_cache: Dict[Tuple[str, Tuple[int, int, int]], pygame.Surface] = {}
+        self._button_labels = {
+            name: self.button_font.render(name, True, (255, 255, 255))
+            for name in ("Undo", "Redeal", "New Game")
+        }
+        self._border_overlay = pygame.Surface((CARD_WIDTH, CARD_HEIGHT), pygame.SRCALPHA)
+        pygame.draw.rect(self._border_overlay, (255, 255, 255), self._border_overlay.get_rect(), 1)
+        self._highlight_overlay = pygame.Surface((CARD_WIDTH, CARD_HEIGHT), pygame.SRCALPHA)
+        pygame.draw.rect(self._highlight_overlay, (255, 215, 0), self._highlight_overlay.get_rect(), 4)
 
     def set_screen(self, screen: pygame.Surface) -> None:
         self.screen = screen
+        self._cache_key = None
+        self._layout_width = None
+
+    def refresh(self) -> None:
+        """Force the next draw to re-present the full frame (window exposed/restored)."""
+        self._present_size = None
+
+    def pyramid_card_rects(self) -> List[pygame.Rect]:
+        width, _ = self.screen.get_size()
+        if width != self._layout_width:
+            self._recompute_layout(width)
+        return self._card_rects
+
+    def _recompute_layout(self, width: int) -> None:
+        start_x = width // 2 - CARD_WIDTH // 2
+        start_y = PLAY_AREA_TOP
+        self._card_rects = []
+        for row_index, col_index in PYRAMID_ROW_COLS:
+            row_width = CARD_WIDTH + (CARD_WIDTH + CARD_SPACING_X) * row_index
+            offset_x = start_x - row_width // 2
+            x = offset_x + col_index * (CARD_WIDTH + CARD_SPACING_X)
+            y = start_y + row_index * (CARD_HEIGHT + CARD_SPACING_Y)
+            self._card_rects.append(pygame.Rect(x, y, CARD_WIDTH, CARD_HEIGHT))
+        self._layout_width = width
 
     def show_message(self, text: str) -> None:
         self.message = text
@@ -625,61 +786,153 @@ class Renderer:
             self.buttons[name] = rect
             y += BUTTON_HEIGHT + 10
 
+    def _static_background(self, width: int, height: int) -> pygame.Surface:
+        # Background fill and button chrome never change for a given size.
+        if self._bg_cache is None or self._bg_cache.get_size() != (width, height):
+            background = pygame.Surface((width, height))
+            background.fill(self.background_color)
+            self.update_buttons(width, height)
+            screen = self.screen
+            self.screen = background
+            try:
+                self.draw_buttons()
+            finally:
+                self.screen = screen
+            self._bg_cache = background
+        return self._bg_cache
+
     def draw(self, state: GameState, selection: Optional[SelectedCard]) -> None:
         width, height = self.screen.get_size()
-        self.screen.fill(self.background_color)
-        self.update_buttons(width, height)
-        self.draw_pyramid(state, selection)
-        self.draw_stock_and_waste(state, selection)
-        self.draw_hud(state)
-        self.draw_buttons(state)
-        self.draw_message()
-        pygame.display.flip()
+        cache_key = (
+            (width, height),
+            state.generation,
+            len(state.history),
+            state.removed_count,
+            selection.location if selection else None,
+            len(state.waste),
+            len(state.stock),
+            state.redeals_used,
+        )
+        if self._cached_surface is None or cache_key != self._cache_key:
+            if self._cached_surface is None or self._cached_surface.get_size() != (width, height):
+                self._cached_surface = pygame.Surface((width, height))
+            background = self._static_background(width, height)
+            screen = self.screen
+            self.screen = self._cached_surface
+            try:
+                self.screen.blit(background, (0, 0))
+                self.draw_pyramid(state, selection)
+                self.draw_stock_and_waste(state, selection)
+                self.draw_hud(state)
+            finally:
+                self.screen = screen
+            self._cache_key = cache_key
+            previous_message = self._message_rect
+            self.screen.blit(self._cached_surface, (0, 0))
+            self._message_rect = self.draw_message()
+            if self._present_size != (width, height):
+                self._present_size = (width, height)
+                pygame.display.flip()
+                return
+            # Same-size recomposition: only the play areas can have changed.
+            rects = self.pyramid_card_rects()
+            dirty = [rects[0].unionall(rects)]
+            dirty.append(
+                pygame.Rect(
+                    STOCK_X, PLAY_AREA_TOP, CARD_WIDTH * 2 + CARD_SPACING_X, CARD_HEIGHT
+                )
+            )
+            dirty.append(pygame.Rect(0, 40, width, HUD_FONT_SIZE + 12))
+            if previous_message is not None:
+                dirty.append(previous_message)
+            if self._message_rect is not None:
+                dirty.append(self._message_rect)
+            pygame.display.update(dirty)
+            return
+        if self._present_size != (width, height):
+            # The window contents were lost (exposed/restored); re-present everything.
+            self.screen.blit(self._cached_surface, (0, 0))
+            self._message_rect = self.draw_message()
+            self._present_size = (width, height)
+            pygame.display.flip()
+            return
+        # Cached frame is already on screen; only the message area can change.
+        dirty: List[pygame.Rect] = []
+        if self._message_rect is not None:
+            self.screen.blit(self._cached_surface, self._message_rect, self._message_rect)
+            dirty.append(self._message_rect)
+        self._message_rect = self.draw_message()
+        if self._message_rect is not None:
+            dirty.append(self._message_rect)
+        if dirty:
+            pygame.display.update(dirty)
 
     def draw_pyramid(self, state: GameState, selection: Optional[SelectedCard]) -> None:
-        width, _ = self.screen.get_size()
-        start_x = width // 2 - CARD_WIDTH // 2
-        start_y = PLAY_AREA_TOP
-        for row_index, row in enumerate(state.pyramid.rows):
-            row_width = CARD_WIDTH + (CARD_WIDTH + CARD_SPACING_X) * (row_index)
-            offset_x = start_x - row_width // 2
-            y = start_y + row_index * (CARD_HEIGHT + CARD_SPACING_Y)
-            for col_index, card in enumerate(row):
-                x = offset_x + col_index * (CARD_WIDTH + CARD_SPACING_X)
-                rect = pygame.Rect(x, y, CARD_WIDTH, CARD_HEIGHT)
+        rects = self.pyramid_card_rects()
+        bbox = rects[0].unionall(rects)
+        selected = (
+            selection.location
+            if selection and selection.location[0] == LOC_PYRAMID
+            else None
+        )
+        atlas_key = (
+            tuple(card.key if card else None for card in state.pyramid.cards),
+            state.pyramid.exposed_mask,
+            selected,
+            self._layout_width,
+        )
+        if self._pyramid_atlas is None or atlas_key != self._pyramid_atlas_key:
+            atlas = pygame.Surface(bbox.size, pygame.SRCALPHA)
+            blits: List[Tuple[pygame.Surface, pygame.Rect]] = []
+            for (row_index, col_index), rect in zip(PYRAMID_ROW_COLS, rects):
+                card = state.pyramid.card_at(row_index, col_index)
                 if card is None:
                     continue
+                local = rect.move(-bbox.x, -bbox.y)
                 if state.pyramid.is_exposed(row_index, col_index):
-                    image = self.assets.get_surface(card)
-                    self.screen.blit(image, rect)
-                    if selection and selection.location == ("pyramid", row_index, col_index):
-                        self._draw_highlight(rect)
+                    blits.append((self.assets.get_surface(card), local))
+                    if selected == (LOC_PYRAMID, row_index, col_index):
+                        blits.append((self._highlight_overlay, local))
                     else:
-                        pygame.draw.rect(self.screen, (255, 255, 255), rect, 1)
+                        blits.append((self._border_overlay, local))
                 else:
-                    self.screen.blit(self.assets.get_back_surface(), rect)
+                    blits.append((self.assets.get_back_surface(), local))
+            atlas.blits(blits, doreturn=0)
+            self._pyramid_atlas = atlas
+            self._pyramid_atlas_key = atlas_key
+        self.screen.blit(self._pyramid_atlas, bbox)
 
     def draw_stock_and_waste(self, state: GameState, selection: Optional[SelectedCard]) -> None:
         start_x = STOCK_X
         y = PLAY_AREA_TOP
+        blits: List[Tuple[pygame.Surface, pygame.Rect]] = []
+        strokes: List[Tuple[Tuple[int, int, int], pygame.Rect, int]] = []
         stock_rect = pygame.Rect(start_x, y, CARD_WIDTH, CARD_HEIGHT)
         if state.stock:
-            self.screen.blit(self.assets.get_back_surface(), stock_rect)
+            blits.append((self.assets.get_back_surface(), stock_rect))
         else:
-            pygame.draw.rect(self.screen, (50, 70, 50), stock_rect, 2)
-        pygame.draw.rect(self.screen, (0, 0, 0), stock_rect, 2)
+            strokes.append(((50, 70, 50), stock_rect, 2))
 
         waste_rect = pygame.Rect(start_x + CARD_WIDTH + CARD_SPACING_X, y, CARD_WIDTH, CARD_HEIGHT)
         if state.waste:
             card = state.waste[-1]
-            self.screen.blit(self.assets.get_surface(card), waste_rect)
-            if selection and selection.location == ("waste", len(state.waste) - 1, 0):
-                self._draw_highlight(waste_rect)
+            blits.append((self.assets.get_surface(card), waste_rect))
+            if selection and selection.location == (LOC_WASTE, len(state.waste) - 1, 0):
+                blits.append((self._highlight_overlay, waste_rect))
             else:
-                pygame.draw.rect(self.screen, (255, 255, 255), waste_rect, 1)
+                blits.append((self._border_overlay, waste_rect))
         else:
-            pygame.draw.rect(self.screen, (50, 70, 50), waste_rect, 2)
-        pygame.draw.rect(self.screen, (0, 0, 0), waste_rect, 2)
+            strokes.append(((50, 70, 50), waste_rect, 2))
+        strokes.append(((0, 0, 0), stock_rect, 2))
+        strokes.append(((0, 0, 0), waste_rect, 2))
+        self.screen.blits(blits, doreturn=0)
+        # Lock once around the stroke batch; blits must happen while unlocked.
+        self.screen.lock()
+        try:
+            for color, rect, width in strokes:
+                pygame.draw.rect(self.screen, color, rect, width)
+        finally:
+            self.screen.unlock()
 
     def draw_hud(self, state: GameState) -> None:
         waste_text = str(state.waste[-1]) if state.waste else "Empty"
@@ -689,29 +942,57 @@ class Renderer:
             f"Removed: {state.removed_count}/28 | Redeals: {state.redeals_used}/{state.max_redeals} | "
             f"Seed: {seed_text}"
         )
-        surface = self.font.render(text, True, (255, 255, 255))
+        surface = self._render_text(text, (255, 255, 255))
         self.screen.blit(surface, (40, 40))
 
-    def draw_buttons(self, state: GameState) -> None:
+    def draw_buttons(self) -> None:
+        self.screen.lock()
+        try:
+            for rect in self.buttons.values():
+                pygame.draw.rect(self.screen, (80, 80, 80), rect)
+                pygame.draw.rect(self.screen, (0, 0, 0), rect, 2)
+        finally:
+            self.screen.unlock()
         for name, rect in self.buttons.items():
-            color = (80, 80, 80)
-            pygame.draw.rect(self.screen, color, rect)
-            pygame.draw.rect(self.screen, (0, 0, 0), rect, 2)
-            text = self.button_font.render(name, True, (255, 255, 255))
+            text = self._button_labels[name]
             text_rect = text.get_rect(center=rect.center)
             self.screen.blit(text, text_rect)
 
-    def draw_message(self) -> None:
+    def _render_text(self, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        key = (text, color)
+        surface = self._text_cache.pop(key, None)
+        if surface is None:
+            surface = self.font.render(text, True, color).convert_alpha()
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                self._text_cache.pop(next(iter(self._text_cache)))
+        # Re-insert so the dict stays ordered least- to most-recently used.
+        self._text_cache[key] = surface
+        return surface
+
+    def draw_message(self) -> Optional[pygame.Rect]:
         if self.message and time.time() < self.message_until:
-            surface = self.font.render(self.message, True, (255, 220, 0))
+            surface = self._render_text(self.message, (255, 220, 0))
             message_y = max(40, PLAY_AREA_TOP - 20)
             rect = surface.get_rect(center=(self.screen.get_width() // 2, message_y))
             self.screen.blit(surface, rect)
-        elif self.message and time.time() >= self.message_until:
+            return rect
+        if self.message:
             self.message = None
+        return None
 
     def _draw_highlight(self, rect: pygame.Rect) -> None:
-        pygame.draw.rect(self.screen, (255, 215, 0), rect, 4)
+        self.screen.blit(self._highlight_overlay, rect)
+
+
+# Event types the game actually handles; everything else is dropped in C.
+HANDLED_EVENT_TYPES = [
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.VIDEORESIZE,
+    pygame.WINDOWEXPOSED,
+    pygame.WINDOWRESTORED,
+]
 
 
 class Game:
@@ -724,9 +1005,15 @@ class Game:
         self.game_over = False
 
     def run(self) -> None:
-        clock = pygame.time.Clock()
+        self.renderer.draw(self.state, self.selection)
         while self.running:
-            for event in pygame.event.get():
+            # Block until an event arrives; wake periodically so timed messages
+            # can fade out without a busy 60 FPS loop.
+            timeout = EVENT_WAIT_MESSAGE_MS if self.renderer.message else EVENT_WAIT_IDLE_MS
+            first = pygame.event.wait(timeout)
+            events = [first] if first.type in HANDLED_EVENT_TYPES else []
+            events.extend(pygame.event.get(HANDLED_EVENT_TYPES))
+            for event in events:
                 if event.type == pygame.QUIT:
                     self.running = False
                 elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
@@ -735,9 +1022,11 @@ class Game:
                     self.handle_click(event.pos)
                 elif event.type == pygame.VIDEORESIZE:
                     self.renderer.set_screen(pygame.display.set_mode(event.size, pygame.RESIZABLE))
-            self.renderer.draw(self.state, self.selection)
+                elif event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED):
+                    self.renderer.refresh()
             self.check_end_conditions()
-            clock.tick(60)
+            if events or self.renderer.message:
+                self.renderer.draw(self.state, self.selection)
 
     def handle_click(self, position: Tuple[int, int]) -> None:
         if time.time() - self.last_click_time < 0.1:
@@ -796,7 +1085,7 @@ class Game:
         rect = pygame.Rect(STOCK_X + CARD_WIDTH + CARD_SPACING_X, PLAY_AREA_TOP, CARD_WIDTH, CARD_HEIGHT)
         if rect.collidepoint(position):
             index = len(self.state.waste) - 1
-            location = ("waste", index, 0)
+            location = (LOC_WASTE, index, 0)
             card = self.state.get_card(location)
             if not card:
                 return True
@@ -822,100 +1111,132 @@ class Game:
         return False
 
     def handle_pyramid_click(self, position: Tuple[int, int]) -> bool:
-        width, _ = self.renderer.screen.get_size()
-        start_x = width // 2 - CARD_WIDTH // 2
-        start_y = PLAY_AREA_TOP
-        for row_index, row in enumerate(self.state.pyramid.rows):
-            row_width = CARD_WIDTH + (CARD_WIDTH + CARD_SPACING_X) * row_index
-            offset_x = start_x - row_width // 2
-            y = start_y + row_index * (CARD_HEIGHT + CARD_SPACING_Y)
-            for col_index, card in enumerate(row):
-                if card is None:
-                    continue
-                rect = pygame.Rect(
-                    offset_x + col_index * (CARD_WIDTH + CARD_SPACING_X),
-                    y,
-                    CARD_WIDTH,
-                    CARD_HEIGHT,
-                )
-                if rect.collidepoint(position):
-                    location = ("pyramid", row_index, col_index)
-                    if not self.state.pyramid.is_exposed(row_index, col_index):
-                        self.renderer.show_message("Card is covered")
-                        return True
-                    if card.value == 13:
-                        if self.state.remove_king(location):
-                            self.renderer.show_message("King removed")
-                            self.game_over = False
-                            self.selection = None
-                        return True
-                    if self.selection and self.selection.location == location:
-                        self.selection = None
-                        return True
-                    if self.selection:
-                        if self.state.remove_pair(self.selection.location, location):
-                            self.renderer.show_message("Pair removed")
-                            self.game_over = False
-                        else:
-                            self.renderer.show_message("Invalid pair")
-                        self.selection = None
-                    else:
-                        self.selection = SelectedCard(location)
-                    return True
-        return False
+        # Card rects never overlap, so a single C-level scan finds the hit.
+        idx = pygame.Rect(position, (1, 1)).collidelist(self.renderer.pyramid_card_rects())
+        if idx < 0:
+            return False
+        row_index, col_index = PYRAMID_ROW_COLS[idx]
+        card = self.state.pyramid.card_at(row_index, col_index)
+        if card is None:
+            return False
+        location = (LOC_PYRAMID, row_index, col_index)
+        if not self.state.pyramid.is_exposed(row_index, col_index):
+            self.renderer.show_message("Card is covered")
+            return True
+        if card.value == 13:
+            if self.state.remove_king(location):
+                self.renderer.show_message("King removed")
+                self.game_over = False
+                self.selection = None
+            return True
+        if self.selection and self.selection.location == location:
+            self.selection = None
+            return True
+        if self.selection:
+            if self.state.remove_pair(self.selection.location, location):
+                self.renderer.show_message("Pair removed")
+                self.game_over = False
+            else:
+                self.renderer.show_message("Invalid pair")
+            self.selection = None
+        else:
+            self.selection = SelectedCard(location)
+        return True
 
     def check_end_conditions(self) -> None:
-        if not self.game_over and self.state.has_won():
+        if self.game_over:
+            return
+        if self.state.has_won():
             self.renderer.show_message("You cleared the pyramid!")
             self.game_over = True
-        elif not self.game_over and not self.state.legal_moves_remaining():
+        elif not self.state.legal_moves_remaining():
             self.renderer.show_message("No more moves. You lose.")
             self.game_over = True
 
 
-def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="Play Pyramid (Match-13) Solitaire")
-    parser.add_argument("--seed", type=int, default=None, help="Random seed for deterministic shuffles")
-    parser.add_argument("--redeals", type=int, default=MAX_REDEALS_DEFAULT, help="Maximum number of redeals")
-    parser.add_argument(
-        "--window", type=str, default=f"{WINDOW_DEFAULT[0]}x{WINDOW_DEFAULT[1]}", help="Window size WxH"
+USAGE = """usage: pyramid.py [--seed N] [--redeals N] [--window WxH]
+
+Play Pyramid (Match-13) Solitaire.
+
+  --seed N      Random seed for deterministic shuffles
+  --redeals N   Maximum number of redeals
+  --window WxH  Window size (default {}x{})
+""".format(*WINDOW_DEFAULT)
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> types.SimpleNamespace:
+    """Parse the three supported flags without the weight of argparse."""
+    args = types.SimpleNamespace(
+        seed=None,
+        redeals=MAX_REDEALS_DEFAULT,
+        window=f"{WINDOW_DEFAULT[0]}x{WINDOW_DEFAULT[1]}",
     )
-    return parser.parse_args(argv)
+    tokens = iter(sys.argv[1:] if argv is None else argv)
+    for token in tokens:
+        name, _, value = token.partition("=")
+        if name in ("-h", "--help"):
+            print(USAGE, end="")
+            sys.exit(0)
+        if name not in ("--seed", "--redeals", "--window"):
+            print(f"Unknown argument '{token}'.\n{USAGE}", file=sys.stderr, end="")
+            sys.exit(2)
+        if not _:
+            value = next(tokens, None)
+            if value is None:
+                print(f"Missing value for '{name}'.", file=sys.stderr)
+                sys.exit(2)
+        if name == "--window":
+            args.window = value
+        else:
+            try:
+                setattr(args, name[2:], int(value))
+            except ValueError:
+                print(f"Invalid value '{value}' for '{name}': expected an integer.", file=sys.stderr)
+                sys.exit(2)
+    return args
+
+
+_WINDOW_SIZE_RE = re.compile(r"(\d+)x(\d+)", re.IGNORECASE)
 
 
 def parse_window_size(text: str) -> Tuple[int, int]:
-    try:
-        width_str, height_str = text.lower().split("x")
-        width = int(width_str)
-        height = int(height_str)
-        return max(width, 640), max(height, 480)
-    except Exception as exc:
-        raise argparse.ArgumentTypeError(f"Invalid window size '{text}'. Use format WxH.") from exc
+    match = _WINDOW_SIZE_RE.fullmatch(text)
+    if not match:
+        raise ValueError(f"Invalid window size '{text}'. Use format WxH.")
+    return max(int(match[1]), 640), max(int(match[2]), 480)
 
 
 def main(argv: Optional[Sequence[str]] = None) -> int:
     args = parse_args(argv)
     try:
         window_size = parse_window_size(args.window)
-    except argparse.ArgumentTypeError as exc:
+    except ValueError as exc:
         print(exc, file=sys.stderr)
         return 2
-    pygame.init()
+    # Only display and font are used; skip pygame.init()'s audio/joystick setup.
+    pygame.display.init()
+    pygame.font.init()
     assets = AssetsManager(ASSETS_DIR)
     try:
         assets.ensure_assets()
     except Exception as exc:
         print(exc, file=sys.stderr)
-        pygame.quit()
+        pygame.font.quit()
+        pygame.display.quit()
         return 1
     screen = pygame.display.set_mode(window_size, pygame.RESIZABLE)
     pygame.display.set_caption("Pyramid (Match-13) Solitaire")
+    # Drop unused events (mouse motion, window focus, ...) at the SDL layer
+    # so the queue only ever holds events the game actually reads.
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(HANDLED_EVENT_TYPES)
     assets.load_images()
     state = GameState(seed=args.seed, max_redeals=args.redeals)
     renderer = Renderer(screen, assets)
     game = Game(state, renderer)
     game.run()
-    pygame.quit()
+    pygame.font.quit()
+    pygame.display.quit()
     return 0
 
 